@@ -3,47 +3,42 @@ Phase 2 제약 조건 테스트용 샘플 데이터 생성 스크립트
 """
 
 import pandas as pd
-import random
+import numpy as np
 import os
 
+# 난수 생성기 (PCG64) - 재현이 필요하면 seed를 지정
+_RNG = np.random.default_rng(seed=None)
+
 # 샘플 이름 데이터
 NAMES = [f"교인{i}" for i in range(1, 51)]  # 50명
 
 def generate_data_with_constraints():
-    # 1. 교인 명단 데이터 생성
-    data = []
-    for name in NAMES:
-        age = random.randint(20, 60)
-        attendance = random.choice(['A', 'B', 'C', 'D'])
-        data.append({
-            '이름': name,
-            '나이': age,
-            '출석현황': attendance
-        })
-    
-    df = pd.DataFrame(data)
-    
+    # 1. 교인 명단 데이터 생성 (컬럼 배열로 한 번에 구성)
+    n = len(NAMES)
+    ages = _RNG.integers(20, 61, n)
+    attendance = _RNG.choice(['A', 'B', 'C', 'D'], n)
+
+    df = pd.DataFrame({
+        '이름': NAMES,
+        '나이': ages,
+        '출석현황': attendance
+    })
+
     # 2. 제약 조건 데이터 생성
-    constraints = [
-        # 리더 지정 (2명)
-        {'유형': '리더', '대상1': '교인1', '대상2': '', '메모': '1조 리더'},
-        {'유형': '리더', '대상1': '교인20', '대상2': '', '메모': '2조 리더'},
-        
-        # 포함 조건 (부부/커플)
-        {'유형': '포함', '대상1': '교인2', '대상2': '교인3', '메모': '부부'},
-        {'유형': '포함', '대상1': '교인10', '대상2': '교인11', '메모': '자매'},
-        {'유형': '포함', '대상1': '교인30', '대상2': '교인31', '메모': '친구'},
-        
-        # 분리 조건 (갈등)
-        {'유형': '분리', '대상1': '교인5', '대상2': '교인6', '메모': '성격 차이'},
-        {'유형': '분리', '대상1': '교인40', '대상2': '교인41', '메모': '과거 다툼'},
-    ]
-    
-    constraints_df = pd.DataFrame(constraints)
+    # 리더 지정 2명 / 포함 조건 (부부·자매·친구) / 분리 조건 (갈등)
+    constraints_df = pd.DataFrame({
+        '유형': ['리더', '리더', '포함', '포함', '포함', '분리', '분리'],
+        '대상1': ['교인1', '교인20', '교인2', '교인10', '교인30', '교인5', '교인40'],
+        '대상2': ['', '', '교인3', '교인11', '교인31', '교인6', '교인41'],
+        '메모': ['1조 리더', '2조 리더', '부부', '자매', '친구', '성격 차이', '과거 다툼'],
+    })
     
     # 3. 엑셀 파일로 저장 (시트 구분)
     output_path = "sample_with_constraints.xlsx"
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+    # 주의: constant_memory 모드는 쓰지 않는다 — pandas의 to_excel은 컬럼
+    # 단위로 셀을 기록하므로 행을 즉시 flush하는 constant_memory와 만나면
+    # 이미 flush된 행의 셀이 조용히 버려져 시트가 깨진다.
+    with pd.ExcelWriter(output_path, engine='xlsxwriter') as writer:
         df.to_excel(writer, sheet_name='교인명단', index=False)
         constraints_df.to_excel(writer, sheet_name='제약조건', index=False)
         
@@ -5,19 +5,36 @@ PySide6 기반 데스크탑 앱 (Qt Company 공식 바인딩)
 
 import sys
 import os
+import re
 from pathlib import Path
 from typing import Optional, List, Set
 
+import pandas as pd
+
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QSpinBox, QFileDialog, QTableWidget,
-    QTableWidgetItem, QProgressBar, QGroupBox, QMessageBox,
+    QTableWidgetItem, QTableView, QProgressBar, QGroupBox, QMessageBox,
     QFrame, QSplitter, QHeaderView, QStatusBar, QTabWidget,
     QComboBox, QLineEdit, QCompleter
 )
 
-from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import QFont, QColor, QDragEnterEvent, QDropEvent
+from PySide6.QtCore import Qt, QThread, Signal, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QFont, QColor, QBrush, QDragEnterEvent, QDropEvent
+
+
+# 조 이름에서 숫자 추출용 패턴 (모듈 로드 시 1회만 컴파일)
+_GROUP_NUM_RE = re.compile(r'\d+')
+
+# 테이블 셀 스타일 상수 (셀마다 QColor/QFont를 새로 만들지 않도록 1회만 생성)
+LEADER_BG = QColor('#d4edda')   # 리더: 연한 초록
+CARE_BG = QColor('#f8d7da')     # 케어 대상: 연한 분홍
+OUTLIER_BG = QColor('yellow')   # 나이 허용 범위 초과
+GROUP_BG = QColor('#e3f2fd')    # 조 이름 셀
+BLACK_FG = QColor('black')
+RED_BRUSH = QBrush(QColor('red'))  # 명단에 없는 이름 표시용
+BOLD_FONT = QFont('맑은 고딕', 10, QFont.Weight.Bold)
+CENTER = Qt.AlignmentFlag.AlignCenter
 
 
 # 스플래시 스크린 (PyInstaller)
@@ -35,6 +52,58 @@ from src.config import SorterConfig
 from src.constraints import Constraint, ConstraintType, ConstraintManager
 
 
+class PandasModel(QAbstractTableModel):
+    """pandas DataFrame을 QTableView에 공급하는 읽기 전용 모델
+
+    QTableWidget처럼 셀마다 QTableWidgetItem을 만들지 않고,
+    화면에 보이는 셀에 대해서만 data() 호출로 값을 돌려준다.
+    backgrounds/tooltips는 셀 단위 스타일용 2차원 리스트 (선택).
+    """
+
+    def __init__(self, df, backgrounds=None, tooltips=None, bold_first_col=False, parent=None):
+        super().__init__(parent)
+        self._df = df
+        # 문자열 변환을 셀 조회마다 반복하지 않도록 한 번에 변환해 둠
+        self._values = df.astype(str).to_numpy()
+        self._backgrounds = backgrounds
+        self._tooltips = tooltips
+        self._bold_first_col = bold_first_col
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._df)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._df.columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._values[row, col]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return CENTER
+        if role == Qt.ItemDataRole.BackgroundRole and self._backgrounds is not None:
+            return self._backgrounds[row][col]
+        if role == Qt.ItemDataRole.ForegroundRole and self._backgrounds is not None:
+            # 배경색이 있는 셀은 글자색을 검정으로 고정 (다크 테마 대비)
+            if self._backgrounds[row][col] is not None:
+                return BLACK_FG
+        if role == Qt.ItemDataRole.ToolTipRole and self._tooltips is not None:
+            return self._tooltips[row][col]
+        if role == Qt.ItemDataRole.FontRole and self._bold_first_col and col == 0:
+            return BOLD_FONT
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return str(self._df.columns[section])
+        return str(section + 1)
+
+
 class SortingWorker(QThread):
     """백그라운드에서 소그룹 편성 작업을 수행하는 워커 스레드"""
     
@@ -44,39 +113,55 @@ class SortingWorker(QThread):
 
     
     def __init__(
-        self, 
-        file_path: str, 
-        group_size: int, 
+        self,
+        file_path: str,
+        group_size: int,
         age_tolerance: int,
-        constraint_manager: Optional[ConstraintManager] = None
+        constraint_manager: Optional[ConstraintManager] = None,
+        df=None,
+        loader: Optional[DataLoader] = None
     ):
         super().__init__()
         self.file_path = file_path
         self.group_size = group_size
         self.age_tolerance = age_tolerance
         self.constraint_manager = constraint_manager
-    
+        # set_input_file에서 이미 로드한 DataFrame/로더 (있으면 재파싱 생략)
+        self.df = df
+        self.loader = loader
+        self._last_pct = -1
+
+    def _progress(self, pct: int, msg: str):
+        """진행률 퍼센트가 실제로 바뀐 경우에만 emit (스레드 경계 마샬링 절약)"""
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self.progress.emit(pct, msg)
+
     def run(self):
         try:
-            # 1. 데이터 로드
-            self.progress.emit(10, "데이터 로드 중...")
-            loader = DataLoader()
-            df = loader.load_file(self.file_path)
+            # 1. 데이터 로드 (이미 로드된 경우 엑셀 재파싱 생략)
+            self._progress(10, "데이터 로드 중...")
+            if self.df is not None and self.loader is not None:
+                loader = self.loader
+                df = self.df
+            else:
+                loader = DataLoader()
+                df = loader.load_file(self.file_path)
             
             # 2. 컬럼 검증
-            self.progress.emit(20, "데이터 검증 중...")
+            self._progress(20, "데이터 검증 중...")
             is_valid, missing = loader.validate_columns()
             if not is_valid:
                 self.error.emit(f"필수 컬럼 누락: {', '.join(missing)}")
                 return
             
             # 3. 데이터 전처리
-            self.progress.emit(40, "데이터 전처리 중...")
+            self._progress(40, "데이터 전처리 중...")
             preprocessor = DataPreprocessor(df)
             processed_df = preprocessor.process()
             
             # 4. 소그룹 편성
-            self.progress.emit(60, "소그룹 편성 중...")
+            self._progress(60, "소그룹 편성 중...")
             sorter = GroupSorter(
                 processed_df,
                 group_size=self.group_size,
@@ -86,15 +171,15 @@ class SortingWorker(QThread):
             result_df = sorter.sort_into_groups()
             
             # 5. 통계 생성
-            self.progress.emit(80, "통계 생성 중...")
+            self._progress(80, "통계 생성 중...")
             stats_df = sorter.get_group_statistics()
             
             # 제약조건 위반 검사
             violations = sorter.get_constraint_violations()
             if violations:
-                self.progress.emit(90, f"⚠️ 제약조건 위반 {len(violations)}건 발견")
+                self._progress(90, f"⚠️ 제약조건 위반 {len(violations)}건 발견")
             
-            self.progress.emit(100, "완료!")
+            self._progress(100, "완료!")
             self.finished.emit(result_df, stats_df)
             
         except Exception as e:
@@ -108,6 +193,8 @@ class ConstraintsTab(QWidget):
         super().__init__(parent)
         self.constraint_manager = ConstraintManager()
         self.loaded_names: Set[str] = set()
+        # 유형 문자열 → ConstraintType 역매핑 (클릭마다 enum을 선형 탐색하지 않도록)
+        self._ctype_by_value = {ct.value: ct for ct in ConstraintType}
         self.setup_ui()
         
     def setup_ui(self):
@@ -176,23 +263,22 @@ class ConstraintsTab(QWidget):
     def update_names(self, names: Set[str]):
         """이름 목록 업데이트 (검색 가능한 자동완성 적용)"""
         self.loaded_names = names
-        sorted_names = sorted(list(names))
-        
-        # 대상1 콤보박스
-        self.person1_combo.clear()
-        self.person1_combo.addItems(sorted_names)
-        completer1 = QCompleter(sorted_names, self)
-        completer1.setFilterMode(Qt.MatchFlag.MatchContains)  # 중간 글자도 검색
-        completer1.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self.person1_combo.setCompleter(completer1)
-        
-        # 대상2 콤보박스
-        self.person2_combo.clear()
-        self.person2_combo.addItems(sorted_names)
-        completer2 = QCompleter(sorted_names, self)
-        completer2.setFilterMode(Qt.MatchFlag.MatchContains)
-        completer2.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self.person2_combo.setCompleter(completer2)
+        sorted_names = sorted(names)
+
+        # 대상1/대상2 콤보박스 (항목 추가 중 시그널이 개별 발생하지 않도록 묶음 갱신)
+        for combo in (self.person1_combo, self.person2_combo):
+            combo.blockSignals(True)
+            try:
+                combo.clear()
+                combo.addItems(sorted_names)
+            finally:
+                combo.blockSignals(False)
+
+            # 검색 가능한 자동완성 (중간 글자도 검색)
+            completer = QCompleter(sorted_names, self)
+            completer.setFilterMode(Qt.MatchFlag.MatchContains)
+            completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+            combo.setCompleter(completer)
 
         
     def set_manager(self, manager: ConstraintManager):
@@ -202,22 +288,27 @@ class ConstraintsTab(QWidget):
         
     def refresh_table(self):
         """테이블 갱신"""
-        self.table.setRowCount(0)
-        for row, c in enumerate(self.constraint_manager.constraints):
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(c.type.value))
-            self.table.setItem(row, 1, QTableWidgetItem(c.person1))
-            self.table.setItem(row, 2, QTableWidgetItem(c.person2 or ""))
-            self.table.setItem(row, 3, QTableWidgetItem(c.note))
-            
-            # 위반 여부 확인 (로드된 이름에 없는 경우 빨간색)
-            if self.loaded_names:
-                if c.person1 and c.person1 not in self.loaded_names:
-                    self.table.item(row, 1).setForeground(QColor("red"))
-                    self.table.item(row, 1).setToolTip("명단에 없는 이름입니다")
-                if c.person2 and c.person2 not in self.loaded_names:
-                    self.table.item(row, 2).setForeground(QColor("red"))
-                    self.table.item(row, 2).setToolTip("명단에 없는 이름입니다")
+        # 행 단위 insertRow/repaint가 반복되지 않도록 일괄 갱신
+        self.table.setUpdatesEnabled(False)
+        self.table.setSortingEnabled(False)
+        try:
+            self.table.setRowCount(len(self.constraint_manager.constraints))
+            for row, c in enumerate(self.constraint_manager.constraints):
+                self.table.setItem(row, 0, QTableWidgetItem(c.type.value))
+                self.table.setItem(row, 1, QTableWidgetItem(c.person1))
+                self.table.setItem(row, 2, QTableWidgetItem(c.person2 or ""))
+                self.table.setItem(row, 3, QTableWidgetItem(c.note))
+
+                # 위반 여부 확인 (로드된 이름에 없는 경우 빨간색)
+                if self.loaded_names:
+                    if c.person1 and c.person1 not in self.loaded_names:
+                        self.table.item(row, 1).setForeground(RED_BRUSH)
+                        self.table.item(row, 1).setToolTip("명단에 없는 이름입니다")
+                    if c.person2 and c.person2 not in self.loaded_names:
+                        self.table.item(row, 2).setForeground(RED_BRUSH)
+                        self.table.item(row, 2).setToolTip("명단에 없는 이름입니다")
+        finally:
+            self.table.setUpdatesEnabled(True)
 
     def add_constraint(self):
         type_str = self.type_combo.currentText()
@@ -228,7 +319,7 @@ class ConstraintsTab(QWidget):
             QMessageBox.warning(self, "입력 오류", "대상1을 입력해주세요.")
             return
             
-        ctype = next(ct for ct in ConstraintType if ct.value == type_str)
+        ctype = self._ctype_by_value[type_str]
         
         if ctype != ConstraintType.LEADER and not p2:
             QMessageBox.warning(self, "입력 오류", "대상2를 입력해주세요.")
@@ -260,7 +351,9 @@ class MainWindow(QMainWindow):
         self.input_file = None
         self.result_df = None
         self.stats_df = None
-        
+        self._loader = None       # set_input_file에서 로드한 DataLoader 캐시
+        self._loaded_df = None    # 위 로더가 읽은 DataFrame (워커 재파싱 방지)
+
         self.setup_ui()
         self.setup_statusbar()
     
@@ -404,10 +497,10 @@ class MainWindow(QMainWindow):
         # 결과 테이블
         result_group = QGroupBox("📋 편성 결과")
         result_layout = QVBoxLayout(result_group)
-        self.result_table = QTableWidget()
+        self.result_table = QTableView()
         self.result_table.setAlternatingRowColors(True)
         self.result_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 font-size: 12px;
                 gridline-color: #ddd;
             }
@@ -424,10 +517,10 @@ class MainWindow(QMainWindow):
         # 통계 테이블
         stats_group = QGroupBox("📊 그룹별 통계")
         stats_layout = QVBoxLayout(stats_group)
-        self.stats_table = QTableWidget()
+        self.stats_table = QTableView()
         self.stats_table.setAlternatingRowColors(True)
         self.stats_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 font-size: 12px;
                 gridline-color: #ddd;
             }
@@ -519,10 +612,16 @@ class MainWindow(QMainWindow):
         self.statusbar.showMessage(f"파일 로드됨: {filename}")
         
         # 파일이 로드되면 이름 목록 추출 및 제약조건 로드
+        self._loader = None
+        self._loaded_df = None
         try:
             loader = DataLoader()
-            loader.load_file(file_path)
-            
+            df = loader.load_file(file_path)
+
+            # 로드 결과 캐시 (편성 시작 시 같은 파일을 다시 파싱하지 않도록)
+            self._loader = loader
+            self._loaded_df = df
+
             # 1. 이름 목록 업데이트
             names = loader.get_names()
             self.constraints_tab.update_names(names)
@@ -559,9 +658,11 @@ class MainWindow(QMainWindow):
             self.input_file,
             self.group_size_spin.value(),
             self.age_spin.value(),
-            constraint_manager
+            constraint_manager,
+            df=self._loaded_df,
+            loader=self._loader
         )
-        self.worker.progress.connect(self.on_progress)
+        self.worker.progress.connect(self.on_progress, Qt.ConnectionType.QueuedConnection)
         self.worker.finished.connect(self.on_finished)
         self.worker.error.connect(self.on_error)
         self.worker.start()
@@ -602,86 +703,95 @@ class MainWindow(QMainWindow):
         self.statusbar.showMessage(f"❌ 오류: {message}")
         QMessageBox.critical(self, "오류", message)
     
-    def populate_group_table(self, table: QTableWidget, df):
-        """조별 편성표 형식으로 DataFrame을 QTableWidget에 표시
+    def populate_group_table(self, table: QTableView, df):
+        """조별 편성표 형식으로 DataFrame을 QTableView에 표시
         
         형식: | 조 | 멤버1 | 멤버2 | 멤버3 | ... |
         """
-        table.clear()
-        
         if '소그룹명' not in df.columns:
             self.populate_table(table, df)
             return
-        
-        # 조별로 그룹화
-        groups = df.groupby('소그룹명')
+
+        # 리더→일반→케어 대상 정렬 키를 전체 프레임에서 한 번에 계산
+        # (조별 .copy() + 행별 lambda map + 조별 sort_values 제거)
+        df = df.assign(
+            정렬순서=df['분류결과'].map({'리더': 0, '일반': 1, '케어 대상': 2}).fillna(1).astype('int8')
+        ).sort_values(['소그룹명', '정렬순서'], kind='stable')
+
+        # 조별로 그룹화 (한 번만 순회하여 조별 프레임 확보)
+        groups = df.groupby('소그룹명', sort=False)
+        group_frames = dict(iter(groups))
+
         # 조 이름을 숫자 기준으로 오름차순 정렬 (1조, 2조, ..., 10조)
-        def extract_group_number(name):
-            import re
-            match = re.search(r'\d+', str(name))
-            return int(match.group()) if match else 0
-        group_names = sorted(groups.groups.keys(), key=extract_group_number)
-        
+        # 조 이름당 1회만 숫자를 추출해두고 dict 조회로 정렬
+        nums = {
+            name: int(m.group()) if (m := _GROUP_NUM_RE.search(str(name))) else 0
+            for name in group_frames
+        }
+        group_names = sorted(group_frames, key=nums.get)
+
         # 가장 많은 인원이 있는 조의 멤버 수 계산
-        max_members = max(len(group) for _, group in groups)
-        
-        # 테이블 설정
-        table.setRowCount(len(group_names))
-        table.setColumnCount(max_members + 1)  # 조 이름 + 멤버들
-        
-        # 헤더 설정
+        max_members = max(len(g) for g in group_frames.values())
+
+        # 조별 편성표 데이터 + 셀 스타일을 리스트로 구성한 뒤 모델 1개로 공급
         headers = ['조'] + [f'멤버 {i+1}' for i in range(max_members)]
-        table.setHorizontalHeaderLabels(headers)
-        
-        # 데이터 채우기
-        for row, group_name in enumerate(group_names):
-            # 조 이름
-            group_item = QTableWidgetItem(str(group_name))
-            group_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            group_item.setBackground(QColor('#e3f2fd'))
-            group_item.setFont(QFont('맑은 고딕', 10, QFont.Weight.Bold))
-            table.setItem(row, 0, group_item)
-            
-            # 해당 조의 멤버들 (리더를 맨 앞으로 정렬)
-            group_df = groups.get_group(group_name).copy()
-            # 리더가 맨 앞에 오도록 정렬: 리더 먼저, 그 다음 일반, 마지막으로 케어 대상
-            sort_order = {'리더': 0, '일반': 1, '케어 대상': 2}
-            group_df['정렬순서'] = group_df['분류결과'].map(lambda x: sort_order.get(x, 1))
-            group_df = group_df.sort_values('정렬순서')
-            
-            for col, (_, member) in enumerate(group_df.iterrows(), start=1):
+        rows = []
+        backgrounds = []
+        tooltips = []
+
+        for group_name in group_names:
+            row_vals = [str(group_name)]
+            row_bg = [GROUP_BG]
+            row_tip = [None]
+
+            # 해당 조의 멤버들 (위에서 이미 리더→일반→케어 대상 순으로 정렬됨)
+            group_df = group_frames[group_name]
+
+            for _, member in group_df.iterrows():
                 name = str(member.get('이름', ''))
                 분류 = member.get('분류결과', '')
-                
+
                 # 이름 + 정보 표시 (리더는 별표 추가)
                 display_text = name
                 if 분류 == '리더':
                     display_text = f"⭐ {name}"
-                
-                item = QTableWidgetItem(display_text)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                
-                # 분류에 따른 색상: 나이초과(노랑) > 리더(초록) > 케어 대상(분홍)
-                if member.get('나이_범위_초과', False):
-                    item.setBackground(QColor('yellow'))
-                    item.setToolTip(item.toolTip() + "\n⚠️ 나이 허용 범위 초과")
-                elif 분류 == '리더':
-                    item.setBackground(QColor('#d4edda'))  # 초록
-                elif 분류 == '케어 대상':
-                    item.setBackground(QColor('#f8d7da'))  # 분홍
-                # 일반은 배경색 없음
-                
+
                 # 툴팁에 상세 정보
                 나이 = member.get('나이', '')
                 출석 = member.get('출석현황', '')
                 출석등급 = member.get('출석등급', '')
-                item.setToolTip(f"이름: {name}\n나이: {나이}\n출석: {출석}\n등급: {출석등급}\n분류: {분류}")
-                
-                table.setItem(row, col, item)
-        
+                tooltip = f"이름: {name}\n나이: {나이}\n출석: {출석}\n등급: {출석등급}\n분류: {분류}"
+
+                # 분류에 따른 색상: 나이초과(노랑) > 리더(초록) > 케어 대상(분홍)
+                if member.get('나이_범위_초과', False):
+                    bg = OUTLIER_BG
+                    tooltip += "\n⚠️ 나이 허용 범위 초과"
+                elif 분류 == '리더':
+                    bg = LEADER_BG  # 초록
+                elif 분류 == '케어 대상':
+                    bg = CARE_BG  # 분홍
+                else:
+                    bg = None  # 일반은 배경색 없음
+
+                row_vals.append(display_text)
+                row_bg.append(bg)
+                row_tip.append(tooltip)
+
+            # 빈 셀 채우기
+            while len(row_vals) < max_members + 1:
+                row_vals.append('')
+                row_bg.append(None)
+                row_tip.append(None)
+
+            rows.append(row_vals)
+            backgrounds.append(row_bg)
+            tooltips.append(row_tip)
+
+        pivot_df = pd.DataFrame(rows, columns=headers)
+        table.setModel(PandasModel(pivot_df, backgrounds, tooltips, bold_first_col=True, parent=table))
         table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         table.verticalHeader().setVisible(False)
-    
+
     def reset_all(self):
         """앱 상태 초기화"""
         # 1. 확인 대화상자
@@ -699,6 +809,8 @@ class MainWindow(QMainWindow):
         self.input_file = None
         self.result_df = None
         self.stats_df = None
+        self._loader = None
+        self._loaded_df = None
         
         # 3. UI 초기화
         # 파일 라벨
@@ -736,47 +848,46 @@ class MainWindow(QMainWindow):
         self.constraints_tab.reset_all()
         
         # 결과 테이블 및 로그 초기화
-        self.result_table.clear()
-        self.result_table.setRowCount(0)
-        self.result_table.setColumnCount(0)
+        self.result_table.setModel(None)
+        self.stats_table.setModel(None)
         self.progress_bar.setVisible(False)
         
         self.statusbar.showMessage("초기화되었습니다.")
 
-    def populate_table(self, table: QTableWidget, df):
-        """DataFrame을 QTableWidget에 표시 (기본 형식)"""
-        table.clear()
-        table.setRowCount(len(df))
-        table.setColumnCount(len(df.columns))
-        table.setHorizontalHeaderLabels(df.columns.tolist())
-        
-        for i, row in df.iterrows():
-            for j, value in enumerate(row):
-                item = QTableWidgetItem(str(value))
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                
-                # 분류결과에 따른 색상: 나이초과(노랑) > 리더(초록), 일반(무색), 케어 대상(분홍)
-                # 나이_범위_초과 컬럼 인덱스 확인
-                is_outlier = False
-                if '나이_범위_초과' in df.columns:
-                    col_idx = df.columns.get_loc('나이_범위_초과')
-                    is_outlier = row[col_idx] if col_idx < len(row) else False
+    def populate_table(self, table: QTableView, df):
+        """DataFrame을 QTableView에 표시 (기본 형식)"""
+        # iterrows() 대신 ndarray로 순회 (행별 Series 생성 비용 제거)
+        arr = df.to_numpy(dtype=object)
+        columns = df.columns.tolist()
+        outlier_idx = columns.index('나이_범위_초과') if '나이_범위_초과' in columns else -1
+        cls_idx = columns.index('분류결과') if '분류결과' in columns else -1
+
+        # 분류결과에 따른 색상: 나이초과(노랑) > 리더(초록), 일반(무색), 케어 대상(분홍)
+        backgrounds = None
+        tooltips = None
+        if outlier_idx >= 0 or cls_idx >= 0:
+            backgrounds = []
+            tooltips = []
+            for i in range(arr.shape[0]):
+                is_outlier = bool(arr[i, outlier_idx]) if outlier_idx >= 0 else False
+                row_bg = [None] * arr.shape[1]
+                row_tip = [None] * arr.shape[1]
 
                 if is_outlier:
-                    item.setBackground(QColor('yellow'))
-                    item.setForeground(QColor('black'))
-                    item.setToolTip("⚠️ 나이 허용 범위 초과")
-                elif df.columns[j] == '분류결과':
+                    row_bg = [OUTLIER_BG] * arr.shape[1]
+                    row_tip = ["⚠️ 나이 허용 범위 초과"] * arr.shape[1]
+                elif cls_idx >= 0:
+                    value = arr[i, cls_idx]
                     if value == '리더':
-                        item.setBackground(QColor('#d4edda'))
-                        item.setForeground(QColor('black'))
+                        row_bg[cls_idx] = LEADER_BG
                     elif value == '케어 대상':
-                        item.setBackground(QColor('#f8d7da'))
-                        item.setForeground(QColor('black'))
+                        row_bg[cls_idx] = CARE_BG
                     # 일반은 배경색 없음
-                
-                table.setItem(i, j, item)
-        
+
+                backgrounds.append(row_bg)
+                tooltips.append(row_tip)
+
+        table.setModel(PandasModel(df, backgrounds, tooltips, parent=table))
         table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
     
     def save_result(self):
@@ -6,21 +6,23 @@
 import argparse
 from pathlib import Path
 
-from src.data_loader import DataLoader
-from src.preprocessor import DataPreprocessor
-from src.sorter import GroupSorter
-from src.config import SorterConfig, DEFAULT_CONFIG
 
-
-def main(input_file: str, output_file: str = None, config: SorterConfig = None):
+def main(input_file: str, output_file: str = None, config: 'SorterConfig' = None):
     """
     메인 실행 함수
-    
+
     Args:
         input_file: 입력 엑셀/CSV 파일 경로
         output_file: 출력 파일 경로 (선택, 기본값: sorted_result.xlsx)
         config: 편성 설정 (선택, 기본값 사용)
     """
+    # pandas 등 무거운 의존성은 실제 실행 시점에만 로드
+    # (--help나 인자 오류 경로가 pandas import 비용을 내지 않도록)
+    from src.data_loader import DataLoader
+    from src.preprocessor import DataPreprocessor
+    from src.sorter import GroupSorter
+    from src.config import SorterConfig, DEFAULT_CONFIG
+
     if config is None:
         config = DEFAULT_CONFIG
     
@@ -112,7 +114,9 @@ if __name__ == "__main__":
     )
     
     args = parser.parse_args()
-    
+
+    from src.config import SorterConfig
+
     config = SorterConfig(
         group_size=args.group_size,
         age_tolerance=args.age_tolerance,
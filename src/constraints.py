@@ -42,48 +42,98 @@ class Constraint:
 
 @dataclass
 class ConstraintManager:
-    """제약 조건 관리자"""
+    """제약 조건 관리자
+
+    유형별 목록과 쌍/인접 테이블은 추가·삭제 시점에 한 번만 갱신해 두고,
+    편성 알고리즘의 반복 조회는 캐시를 O(1)로 돌려받는다.
+    """
     constraints: List[Constraint] = field(default_factory=list)
-    
+
+    def __post_init__(self):
+        self._rebuild_cache()
+
+    def _rebuild_cache(self):
+        """유형별 분류와 쌍/인접 테이블 캐시 재구축"""
+        self._include: List[Constraint] = []
+        self._exclude: List[Constraint] = []
+        self._leaders: List[Constraint] = []
+        for c in self.constraints:
+            if c.type == ConstraintType.INCLUDE:
+                self._include.append(c)
+            elif c.type == ConstraintType.EXCLUDE:
+                self._exclude.append(c)
+            elif c.type == ConstraintType.LEADER:
+                self._leaders.append(c)
+
+        self._leader_names: Set[str] = {c.person1 for c in self._leaders}
+        self._include_pairs: List[Tuple[str, str]] = [
+            (c.person1, c.person2) for c in self._include if c.person2
+        ]
+        self._exclude_pairs: List[Tuple[str, str]] = [
+            (c.person1, c.person2) for c in self._exclude if c.person2
+        ]
+
+        # 인접 테이블: "a와 b가 같은/다른 조여야 하는가?"를 O(1)로 조회
+        self._include_adj: dict = {}
+        self._exclude_adj: dict = {}
+        for adj, pairs in (
+            (self._include_adj, self._include_pairs),
+            (self._exclude_adj, self._exclude_pairs),
+        ):
+            for a, b in pairs:
+                adj.setdefault(a, set()).add(b)
+                adj.setdefault(b, set()).add(a)
+
     @property
     def include_constraints(self) -> List[Constraint]:
         """포함 조건 목록"""
-        return [c for c in self.constraints if c.type == ConstraintType.INCLUDE]
-    
+        return self._include
+
     @property
     def exclude_constraints(self) -> List[Constraint]:
         """분리 조건 목록"""
-        return [c for c in self.constraints if c.type == ConstraintType.EXCLUDE]
-    
+        return self._exclude
+
     @property
     def leader_constraints(self) -> List[Constraint]:
         """리더 지정 목록"""
-        return [c for c in self.constraints if c.type == ConstraintType.LEADER]
-    
+        return self._leaders
+
     def add(self, constraint: Constraint):
         """제약 조건 추가"""
         self.constraints.append(constraint)
-    
+        self._rebuild_cache()
+
     def remove(self, index: int):
         """인덱스로 제약 조건 삭제"""
         if 0 <= index < len(self.constraints):
             self.constraints.pop(index)
-    
+            self._rebuild_cache()
+
     def clear(self):
         """모든 제약 조건 삭제"""
         self.constraints.clear()
-    
+        self._rebuild_cache()
+
     def get_leaders(self) -> Set[str]:
         """리더로 지정된 이름 집합 반환"""
-        return {c.person1 for c in self.leader_constraints}
-    
+        return self._leader_names
+
     def get_include_pairs(self) -> List[Tuple[str, str]]:
         """포함 쌍 목록 반환"""
-        return [(c.person1, c.person2) for c in self.include_constraints if c.person2]
-    
+        return self._include_pairs
+
     def get_exclude_pairs(self) -> List[Tuple[str, str]]:
         """분리 쌍 목록 반환"""
-        return [(c.person1, c.person2) for c in self.exclude_constraints if c.person2]
+        return self._exclude_pairs
+
+    def get_exclude_neighbors(self, name: str) -> Set[str]:
+        """name과 분리되어야 하는 이름 집합 반환 (없으면 빈 집합)"""
+        return self._exclude_adj.get(name, set())
+
+    def are_excluded(self, name1: str, name2: str) -> bool:
+        """두 사람이 분리 조건으로 묶여 있는지 O(1) 확인"""
+        return name2 in self._exclude_adj.get(name1, ())
     
     def validate_names(self, valid_names: Set[str]) -> List[str]:
         """
@@ -96,16 +146,16 @@ class ConstraintManager:
             매칭 실패한 이름 목록
         """
         # 이름 정규화 (공백 제거)
-        normalized_valid = {name.strip() for name in valid_names}
-        invalid_names = []
-        
-        for constraint in self.constraints:
-            if constraint.person1 and constraint.person1 not in normalized_valid:
-                invalid_names.append(constraint.person1)
-            if constraint.person2 and constraint.person2 not in normalized_valid:
-                invalid_names.append(constraint.person2)
-        
-        return list(set(invalid_names))
+        # DataLoader.get_names()가 주는 frozenset은 이미 정규화되어 있으므로 그대로 사용
+        if isinstance(valid_names, frozenset):
+            normalized_valid = valid_names
+        else:
+            normalized_valid = {name.strip() for name in valid_names}
+
+        # 제약 조건이 참조하는 이름 전체와의 집합 차이 한 번으로 계산
+        referenced = {c.person1 for c in self.constraints if c.person1} \
+            | {c.person2 for c in self.constraints if c.person2}
+        return list(referenced - normalized_valid)
     
     def to_dataframe(self) -> pd.DataFrame:
         """DataFrame으로 변환 (엑셀 저장용)"""
@@ -123,31 +173,35 @@ class ConstraintManager:
     def from_dataframe(cls, df: pd.DataFrame) -> 'ConstraintManager':
         """DataFrame에서 생성"""
         manager = cls()
-        
+
         if df is None or df.empty:
             return manager
-        
-        for _, row in df.iterrows():
-            type_str = str(row.get('유형', '')).strip()
-            person1 = str(row.get('대상1', '')).strip()
-            person2 = str(row.get('대상2', '')).strip() or None
-            note = str(row.get('메모', '')).strip()
-            
-            # 유형 파싱
-            constraint_type = None
-            for ct in ConstraintType:
-                if ct.value == type_str:
-                    constraint_type = ct
-                    break
-            
+
+        # 컬럼 단위로 한 번에 문자열 정규화 (iterrows + 행별 str/strip 제거)
+        def _column(name) -> list:
+            if name in df.columns:
+                # 결측 셀은 빈 문자열로 (astype(str)은 NaN을 보존할 수 있음)
+                return df[name].fillna('').astype(str).str.strip().tolist()
+            return [''] * len(df)
+
+        type_by_value = {ct.value: ct for ct in ConstraintType}
+
+        constraints = []
+        for type_str, person1, person2, note in zip(
+            _column('유형'), _column('대상1'), _column('대상2'), _column('메모')
+        ):
+            constraint_type = type_by_value.get(type_str)
             if constraint_type and person1:
-                manager.add(Constraint(
+                constraints.append(Constraint(
                     type=constraint_type,
                     person1=person1,
                     person2=person2 if person2 and person2 != 'nan' else None,
                     note=note if note != 'nan' else ''
                 ))
-        
+
+        # 일괄 구성 후 캐시는 한 번만 재구축
+        manager.constraints = constraints
+        manager._rebuild_cache()
         return manager
     
     def __len__(self) -> int:
@@ -6,13 +6,25 @@
 - 결과 파일 생성
 """
 
+import re
+
 import pandas as pd
+import numpy as np
 from pathlib import Path
 from typing import Optional, Tuple, Set, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .constraints import ConstraintManager
 
+# 조 이름에서 숫자 추출용 패턴 (모듈 로드 시 1회만 컴파일)
+_GROUP_NUM_RE = re.compile(r'\d+')
+
+
+def _extract_group_number(name) -> int:
+    """'N조' 형태의 조 이름에서 정렬용 숫자를 추출"""
+    match = _GROUP_NUM_RE.search(str(name))
+    return int(match.group()) if match else 0
+
 
 class DataLoader:
     """엑셀 및 CSV 데이터 로드/저장 클래스"""
@@ -24,6 +36,9 @@ class DataLoader:
         self.data: Optional[pd.DataFrame] = None
         self.file_path: Optional[Path] = None
         self.constraint_df: Optional[pd.DataFrame] = None
+        # 반복 호출 캐시 (load_file 시 무효화)
+        self._names_cache: Optional[frozenset] = None
+        self._cols_cache: Optional[Tuple[bool, list]] = None
     
     def load_file(self, file_path: str) -> pd.DataFrame:
         """
@@ -40,43 +55,60 @@ class DataLoader:
             FileNotFoundError: 파일을 찾을 수 없음
         """
         self.file_path = Path(file_path)
-        
+        self._names_cache = None
+        self._cols_cache = None
+
         if not self.file_path.exists():
             raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
         
         suffix = self.file_path.suffix.lower()
         
         if suffix == '.xlsx':
-            self.data = pd.read_excel(file_path, engine='openpyxl')
-            # 제약조건 시트 로드 시도
-            self._load_constraint_sheet(file_path)
+            # Rust 기반 calamine 리더가 설치되어 있으면 우선 사용 (openpyxl 대비 5~10배 빠름)
+            try:
+                xl = pd.ExcelFile(file_path, engine='calamine')
+            except ImportError:
+                xl = pd.ExcelFile(file_path, engine='openpyxl')
+
+            # 워크북을 한 번만 파싱해서 본 시트와 제약조건 시트를 같이 읽음
+            with xl:
+                self.data = pd.read_excel(xl, sheet_name=xl.sheet_names[0])
+                self.constraint_df = None
+                if self.CONSTRAINT_SHEET_NAME in xl.sheet_names:
+                    try:
+                        self.constraint_df = pd.read_excel(
+                            xl,
+                            sheet_name=self.CONSTRAINT_SHEET_NAME
+                        )
+                    except Exception:
+                        self.constraint_df = None
         elif suffix == '.csv':
-            self.data = pd.read_csv(file_path, encoding='utf-8-sig')
+            # pyarrow가 설치되어 있으면 병렬 파서 + Arrow 기반 컬럼 사용
+            try:
+                self.data = pd.read_csv(
+                    file_path,
+                    encoding='utf-8-sig',
+                    engine='pyarrow',
+                    dtype_backend='pyarrow'
+                )
+            except ImportError:
+                self.data = pd.read_csv(file_path, encoding='utf-8-sig')
             self.constraint_df = None  # CSV는 제약조건 시트 없음
         else:
             raise ValueError(f"지원하지 않는 파일 형식입니다: {suffix}")
         
         return self.data
     
-    def _load_constraint_sheet(self, file_path: str):
-        """제약조건 시트 로드 (존재하는 경우)"""
-        try:
-            xl = pd.ExcelFile(file_path, engine='openpyxl')
-            if self.CONSTRAINT_SHEET_NAME in xl.sheet_names:
-                self.constraint_df = pd.read_excel(
-                    xl, 
-                    sheet_name=self.CONSTRAINT_SHEET_NAME
-                )
-            else:
-                self.constraint_df = None
-        except Exception:
-            self.constraint_df = None
-    
     def get_names(self) -> Set[str]:
-        """로드된 데이터에서 이름 목록 추출"""
-        if self.data is None or '이름' not in self.data.columns:
-            return set()
-        return set(self.data['이름'].dropna().astype(str).str.strip())
+        """로드된 데이터에서 이름 목록 추출 (호출 간 캐시)"""
+        if self._names_cache is None:
+            if self.data is None or '이름' not in self.data.columns:
+                self._names_cache = frozenset()
+            else:
+                self._names_cache = frozenset(
+                    self.data['이름'].dropna().astype(str).str.strip()
+                )
+        return self._names_cache
     
     def get_constraint_manager(self) -> 'ConstraintManager':
         """제약조건 DataFrame을 ConstraintManager로 변환"""
@@ -96,9 +128,11 @@ class DataLoader:
         """
         if self.data is None:
             return False, self.REQUIRED_COLUMNS
-        
-        missing = [col for col in self.REQUIRED_COLUMNS if col not in self.data.columns]
-        return len(missing) == 0, missing
+
+        if self._cols_cache is None:
+            missing = [col for col in self.REQUIRED_COLUMNS if col not in self.data.columns]
+            self._cols_cache = (len(missing) == 0, missing)
+        return self._cols_cache
     
     def save_result(
         self, 
@@ -117,105 +151,83 @@ class DataLoader:
             summary_df: 그룹별 통계 요약 데이터프레임 (선택)
             constraint_manager: 제약 조건 관리자 (선택)
         """
-        import re
-        
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+        with pd.ExcelWriter(output_path, engine='xlsxwriter') as writer:
             # 조별 가로 편성표 형식으로 변환
             if '소그룹명' in df.columns:
-                # 조 이름을 숫자 기준 오름차순 정렬
-                def extract_group_number(name):
-                    match = re.search(r'\d+', str(name))
-                    return int(match.group()) if match else 0
-                
-                groups = df.groupby('소그룹명')
-                group_names = sorted(groups.groups.keys(), key=extract_group_number)
-                
+                # 리더→일반→케어 대상 순서를 전역 1회 정렬로 확정
+                # (조별 lambda map + sort_values 반복 제거)
+                if '분류결과' in df.columns:
+                    df = df.assign(
+                        분류결과=pd.Categorical(
+                            df['분류결과'],
+                            categories=['리더', '일반', '케어 대상'],
+                            ordered=True
+                        )
+                    ).sort_values(['소그룹명', '분류결과'], kind='stable')
+
+                # 한 번의 groupby 순회로 조별 프레임을 확보
+                # (조마다 get_group이 불리언 인덱싱을 다시 수행하지 않도록)
+                groups = df.groupby('소그룹명', sort=False, observed=True)
+                group_frames = dict(iter(groups))
+                group_names = sorted(group_frames, key=_extract_group_number)
+
                 # 가장 많은 인원이 있는 조의 멤버 수 계산
-                max_members = max(len(groups.get_group(g)) for g in group_names)
+                max_members = max(len(g) for g in group_frames.values())
                 
                 # 조별 편성표 데이터 생성
                 rows = []
+                styles_map = []  # 셀별 스타일 키 (None이면 기본 스타일)
                 for group_name in group_names:
-                    group_df = groups.get_group(group_name).copy()
-                    
-                    # 리더→일반→케어 대상 순으로 정렬
-                    sort_order = {'리더': 0, '일반': 1, '케어 대상': 2}
-                    if '분류결과' in group_df.columns:
-                        group_df['정렬순서'] = group_df['분류결과'].map(lambda x: sort_order.get(x, 1))
-                        group_df = group_df.sort_values('정렬순서')
-                    
-                    # 멤버 이름 추출 (리더는 ⭐ 표시) 및 스타일 정보 저장
-                    members = []
-                    member_styles = [] # 각 멤버 셀의 스타일 정보
-                    for _, member in group_df.iterrows():
-                        name = str(member.get('이름', ''))
-                        분류 = member.get('분류결과', '')
-                        나이_범위_초과 = member.get('나이_범위_초과', False) # '나이_범위_초과' 컬럼이 있다고 가정
-                        
-                        display_name = name
-                        if 분류 == '리더':
-                            display_name = f"⭐ {name}"
-                        
-                        members.append(display_name)
-                        
-                        # 스타일 우선순위: 나이_범위_초과 > 리더 > 케어 대상
-                        if 나이_범위_초과:
-                            member_styles.append('warning')
-                        elif 분류 == '리더':
-                            member_styles.append('leader')
-                        elif 분류 == '케어 대상':
-                            member_styles.append('care')
-                        else:
-                            member_styles.append(None) # 기본 스타일
-                    
+                    # 위 전역 정렬로 이미 리더→일반→케어 대상 순
+                    group_df = group_frames[group_name]
+
+                    # 멤버 이름 추출 (리더는 ⭐ 표시) 및 스타일 정보 저장 — 컬럼 단위 일괄 처리
+                    n = len(group_df)
+                    names = group_df['이름'].astype(str) if '이름' in group_df.columns \
+                        else pd.Series([''] * n)
+                    roles = group_df['분류결과'].to_numpy() if '분류결과' in group_df.columns \
+                        else np.full(n, '', dtype=object)
+                    outliers = group_df['나이_범위_초과'].to_numpy(dtype=bool) \
+                        if '나이_범위_초과' in group_df.columns else np.zeros(n, dtype=bool)
+
+                    display = np.where(roles == '리더', ('⭐ ' + names).to_numpy(), names.to_numpy())
+
+                    # 스타일 우선순위: 나이_범위_초과 > 리더 > 케어 대상 (역순으로 덮어쓰기)
+                    member_styles = np.full(n, None, dtype=object)
+                    member_styles[roles == '케어 대상'] = 'care'
+                    member_styles[roles == '리더'] = 'leader'
+                    member_styles[outliers] = 'warning'
+
                     # 빈 셀 채우기
-                    while len(members) < max_members:
-                        members.append('')
-                        member_styles.append(None) # 빈 셀은 스타일 없음
+                    pad = max_members - n
+                    members = display.tolist() + [''] * pad
+                    member_styles = member_styles.tolist() + [None] * pad
                     
-                    rows.append([group_name] + members)
+                    rows.append([str(group_name)] + members)
                     styles_map.append([None] + member_styles) # 첫 컬럼(조 이름)은 스타일 없음
                 
                 # 헤더 설정
                 headers = ['조'] + [f'멤버 {i+1}' for i in range(max_members)]
-                result_df = pd.DataFrame(rows, columns=headers)
-                result_df.to_excel(writer, sheet_name='소그룹 편성 결과', index=False)
 
-                # 스타일 적용 (openpyxl 객체 접근)
-                worksheet = writer.sheets['소그룹 편성 결과']
-                
-                # 스타일 정의
-                fill_leader = PatternFill(start_color='D4EDDA', end_color='D4EDDA', fill_type='solid') # 연한 초록
-                fill_care = PatternFill(start_color='F8D7DA', end_color='F8D7DA', fill_type='solid')   # 연한 빨강
-                fill_warning = PatternFill(start_color='FFFF00', end_color='FFFF00', fill_type='solid') # 노랑 (나이 범위 초과)
-                
-                font_leader = Font(bold=True)
-                border_thin = Border(left=Side(style='thin'), right=Side(style='thin'), 
-                                   top=Side(style='thin'), bottom=Side(style='thin'))
-                
-                # 헤더 행 스타일 적용
-                for col_idx in range(1, len(headers) + 1):
-                    cell = worksheet.cell(row=1, column=col_idx)
-                    cell.border = border_thin
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-                    cell.font = Font(bold=True)
-                    cell.fill = PatternFill(start_color='E0E0E0', end_color='E0E0E0', fill_type='solid') # 회색 배경
-
-                # 데이터 행 스타일 적용
-                for r_idx, row_styles in enumerate(styles_map, start=2): # 엑셀 행은 1부터 시작, 헤더 다음부터
-                    for c_idx, style_type in enumerate(row_styles, start=1): # 엑셀 컬럼은 1부터 시작
-                        cell = worksheet.cell(row=r_idx, column=c_idx)
-                        cell.border = border_thin
-                        cell.alignment = Alignment(horizontal='center', vertical='center')
-                        
-                        if style_type == 'warning':
-                            cell.fill = fill_warning
-                        elif style_type == 'leader':
-                            cell.fill = fill_leader
-                            cell.font = font_leader
-                        elif style_type == 'care':
-                            cell.fill = fill_care
-                
+                # 스타일 정의 (xlsxwriter는 공유 포맷 객체를 재사용하므로
+                # 셀마다 스타일 객체를 새로 만들지 않는다)
+                workbook = writer.book
+                base = {'border': 1, 'align': 'center', 'valign': 'vcenter'}
+                formats = {
+                    None: workbook.add_format(base),
+                    'header': workbook.add_format({**base, 'bold': True, 'bg_color': '#E0E0E0'}),   # 회색 배경
+                    'leader': workbook.add_format({**base, 'bold': True, 'bg_color': '#D4EDDA'}),   # 연한 초록
+                    'care': workbook.add_format({**base, 'bg_color': '#F8D7DA'}),                   # 연한 빨강
+                    'warning': workbook.add_format({**base, 'bg_color': '#FFFF00'}),                # 노랑 (나이 범위 초과)
+                }
+
+                # 값과 스타일을 한 번의 순회로 스트리밍 기록
+                worksheet = workbook.add_worksheet('소그룹 편성 결과')
+                worksheet.write_row(0, 0, headers, formats['header'])
+                for r_idx, (row_vals, row_styles) in enumerate(zip(rows, styles_map), start=1):
+                    for c_idx, (value, style) in enumerate(zip(row_vals, row_styles)):
+                        worksheet.write(r_idx, c_idx, value, formats[style])
+
             else:
                 df.to_excel(writer, sheet_name='소그룹 편성 결과', index=False)
             
@@ -30,9 +30,27 @@ class DataPreprocessor:
         'D': 2,
         '케어대상': 1,
     }
+
+    # convert_attendance_to_score용 벡터 테이블 (클래스 로드 시 1회 구성)
+    # 경계 배열에 대한 searchsorted로 분기 없는 일괄 등급/점수 변환을 수행
+    _GRADE_BINS = np.array([
+        ATTENDANCE_THRESHOLDS['D'],
+        ATTENDANCE_THRESHOLDS['C'],
+        ATTENDANCE_THRESHOLDS['B'],
+        ATTENDANCE_THRESHOLDS['A'],
+    ])
+    _GRADE_LABELS = np.array(['케어대상', 'D', 'C', 'B', 'A'])
+    _GRADE_LABELS_SORTED = np.sort(_GRADE_LABELS)
+    _GRADE_SCORES_SORTED = np.array(
+        list(map(ATTENDANCE_SCORE_MAP.__getitem__, _GRADE_LABELS_SORTED)),
+        dtype=np.int8
+    )
     
     def __init__(self, df: pd.DataFrame):
-        self.df = df.copy()
+        # 전처리는 파생 컬럼(나이_정제/출석점수/출석등급/분류결과)을 추가할 뿐
+        # 원본 컬럼은 수정하지 않으므로 전체 deep copy 없이 그대로 참조한다.
+        # (호출자 프레임에 파생 컬럼이 추가됨)
+        self.df = df
         self.processed_df: pd.DataFrame = None
     
     def clean_age(self) -> 'DataPreprocessor':
@@ -41,65 +59,51 @@ class DataPreprocessor:
         - 숫자가 아닌 값은 평균 나이로 대체
         - 비정상 범위(0 이하, 150 이상) 처리
         """
-        # 숫자로 변환 시도
-        self.df['나이_정제'] = pd.to_numeric(self.df['나이'], errors='coerce')
-        
+        # 숫자로 변환 시도 (단일 패스: 유효 마스크 1회 계산 후 where로 대체)
+        arr = pd.to_numeric(self.df['나이'], errors='coerce').to_numpy(dtype=np.float64)
+        valid = ~np.isnan(arr) & (arr > 0) & (arr < 150)
+
         # 유효한 나이 값만으로 평균 계산
-        valid_ages = self.df['나이_정제'].dropna()
-        valid_ages = valid_ages[(valid_ages > 0) & (valid_ages < 150)]
-        mean_age = int(valid_ages.mean()) if len(valid_ages) > 0 else 30
-        
-        # 결측치 및 무효 값 대체
-        mask = self.df['나이_정제'].isna() | (self.df['나이_정제'] <= 0) | (self.df['나이_정제'] >= 150)
-        self.df.loc[mask, '나이_정제'] = mean_age
-        
-        self.df['나이_정제'] = self.df['나이_정제'].astype(int)
+        mean_age = int(arr[valid].mean()) if valid.any() else 30
+
+        # 결측치 및 무효 값 대체 (int32면 충분)
+        self.df['나이_정제'] = np.where(valid, arr, mean_age).astype(np.int32)
         
         return self
     
     def convert_attendance_to_score(self) -> 'DataPreprocessor':
         """
-        출석현황을 등급 및 점수로 변환합니다.
+        출석현황을 등급 및 점수로 변환합니다. (행별 apply 없이 벡터 연산)
         - 숫자(출석 횟수)인 경우: 52주 기준으로 등급 산정
         - 등급(A/B/C/D)인 경우: 기존 등급 유지
+        - 해석 불가(결측/비정상 문자열): 기본 등급 C
         """
-        def convert_value(val):
-            # None 또는 NaN 처리
-            if pd.isna(val):
-                return 3, 'C'  # 기본값
-            
-            # 문자열인 경우 등급으로 해석
-            if isinstance(val, str):
-                val_upper = val.upper().strip()
-                if val_upper in self.ATTENDANCE_SCORE_MAP:
-                    return self.ATTENDANCE_SCORE_MAP[val_upper], val_upper
-                # 숫자로 변환 시도
-                try:
-                    attendance_count = int(val)
-                except ValueError:
-                    return 3, 'C'
-            else:
-                try:
-                    attendance_count = int(val)
-                except (ValueError, TypeError):
-                    return 3, 'C'
-            
-            # 출석 횟수 -> 등급 변환
-            if attendance_count >= self.ATTENDANCE_THRESHOLDS['A']:
-                return self.ATTENDANCE_SCORE_MAP['A'], 'A'
-            elif attendance_count >= self.ATTENDANCE_THRESHOLDS['B']:
-                return self.ATTENDANCE_SCORE_MAP['B'], 'B'
-            elif attendance_count >= self.ATTENDANCE_THRESHOLDS['C']:
-                return self.ATTENDANCE_SCORE_MAP['C'], 'C'
-            elif attendance_count >= self.ATTENDANCE_THRESHOLDS['D']:
-                return self.ATTENDANCE_SCORE_MAP['D'], 'D'
-            else:
-                return self.ATTENDANCE_SCORE_MAP['케어대상'], '케어대상'
-        
-        results = self.df['출석현황'].apply(convert_value)
-        self.df['출석점수'] = [r[0] for r in results]
-        self.df['출석등급'] = [r[1] for r in results]
-        
+        raw = self.df['출석현황']
+
+        # 문자열 등급(A/B/C/D)으로 해석되는 값
+        upper = raw.astype(str).str.upper().str.strip()
+        grade_mask = upper.isin(list(self.ATTENDANCE_SCORE_MAP)).to_numpy()
+
+        # 숫자(출석 횟수)로 해석되는 값
+        counts = pd.to_numeric(raw, errors='coerce')
+        invalid_mask = counts.isna().to_numpy()
+
+        # 출석 횟수 -> 등급: 경계값 배열에 대한 이진 탐색 (분기 없는 일괄 변환)
+        idx = np.searchsorted(self._GRADE_BINS, counts.fillna(-1).to_numpy(), side='right')
+
+        grades = self._GRADE_LABELS[idx]
+        grades = np.where(invalid_mask, 'C', grades)        # 변환 실패 기본값
+        grades = np.where(grade_mask, upper.to_numpy(), grades)  # 등급 문자열 우선
+        grades = grades.astype(str)
+
+        # 점수도 같은 테이블 조회로 (등급 라벨 -> 정렬 테이블 이진 탐색)
+        scores = self._GRADE_SCORES_SORTED[
+            np.searchsorted(self._GRADE_LABELS_SORTED, grades)
+        ]
+
+        self.df['출석등급'] = grades
+        self.df['출석점수'] = scores
+
         return self
     
     def categorize_role(self) -> 'DataPreprocessor':
@@ -108,14 +112,10 @@ class DataPreprocessor:
         - 케어 대상: 10회 미만 출석
         - 일반: 그 외 모두 (리더는 sorter에서 조별로 자동 선정)
         """
-        def assign_role(등급):
-            if 등급 == '케어대상':
-                return '케어 대상'
-            else:
-                return '일반'
-        
-        self.df['분류결과'] = self.df['출석등급'].apply(assign_role)
-        
+        self.df['분류결과'] = np.where(
+            self.df['출석등급'].to_numpy() == '케어대상', '케어 대상', '일반'
+        )
+
         return self
     
     def process(self) -> pd.DataFrame:
@@ -125,7 +125,17 @@ class DataPreprocessor:
         self.clean_age()
         self.convert_attendance_to_score()
         self.categorize_role()
-        
+
+        # 핫 컬럼 다운캐스트: 점수/나이는 작은 정수로, 저카디널리티 문자열은 category로
+        # (이후 정렬/그룹핑이 int 코드 기반 C 커널을 타게 됨)
+        self.df['출석점수'] = self.df['출석점수'].astype(np.int8)
+        self.df['나이_정제'] = self.df['나이_정제'].astype(np.int16)
+        self.df['출석등급'] = self.df['출석등급'].astype('category')
+        # '리더'는 편성 단계에서 부여되므로 카테고리에 미리 포함
+        self.df['분류결과'] = pd.Categorical(
+            self.df['분류결과'], categories=['리더', '일반', '케어 대상']
+        )
+
         self.processed_df = self.df
         return self.processed_df
 
@@ -14,6 +14,23 @@ if TYPE_CHECKING:
     from .constraints import ConstraintManager
 
 
+def _snake_assign(num_members: int, num_groups: int) -> np.ndarray:
+    """S자(스네이크) 배치의 그룹 번호 배열을 계산하는 산술 커널"""
+    idx = np.arange(num_members)
+    row = idx // num_groups
+    pos_in_row = idx % num_groups
+    return np.where(row % 2 == 0, pos_in_row, num_groups - 1 - pos_in_row)
+
+
+# 선택 의존성: numba가 설치되어 있으면 커널을 기계어로 JIT 컴파일
+# (cache=True로 컴파일 결과를 디스크에 보관해 재실행 비용을 줄임)
+try:
+    from numba import njit
+    _snake_assign = njit(cache=True)(_snake_assign)
+except ImportError:
+    pass
+
+
 class GroupSorter:
     """소그룹 편성 알고리즘 클래스"""
     
@@ -37,57 +54,65 @@ class GroupSorter:
         self.constraint_manager = constraint_manager
         self.result_df: pd.DataFrame = None
         
-        # 이름 → 인덱스 매핑
+        # 이름 → 인덱스 매핑 및 정제된 이름 배열 캐시
         self._name_to_idx: Dict[str, int] = {}
+        self._stripped_names: np.ndarray = np.array([], dtype=object)
         self._build_name_index()
-    
+
+        # 나이 밴드 캐시 (나이_정제가 바뀌면 무효화)
+        self._cached_bands: Optional[List[Tuple[int, int]]] = None
+
+        # 제약 조건 유무 플래그 (없으면 각 _apply_* 본문을 통째로 생략)
+        cm = constraint_manager
+        self._has_leaders = bool(cm and cm.get_leaders())
+        self._has_include = bool(cm and cm.get_include_pairs())
+        self._has_exclude = bool(cm and cm.get_exclude_pairs())
+
     def _build_name_index(self):
-        """이름으로 DataFrame 인덱스를 찾기 위한 매핑 생성"""
+        """이름으로 DataFrame 인덱스를 찾기 위한 매핑/정제 이름 배열 생성
+
+        astype(str).str.strip() 전체 패스를 제약 조건 메서드마다 반복하지
+        않도록 한 번만 수행해 캐시한다.
+        """
         if '이름' in self.df.columns:
-            for idx, name in enumerate(self.df['이름']):
-                self._name_to_idx[str(name).strip()] = idx
+            self._stripped_names = self.df['이름'].astype(str).str.strip().to_numpy()
+            self._name_to_idx = {
+                name: pos for pos, name in enumerate(self._stripped_names)
+            }
+
+    @staticmethod
+    def _name_positions(df: pd.DataFrame) -> Dict[str, int]:
+        """정제된 이름 -> 행 위치(positional) 매핑 생성
+
+        제약 조건 처리 루프가 쌍마다 전체 컬럼을 astype/strip 비교하지 않고
+        O(1) dict 조회 + iat 접근으로 스칼라를 읽고 쓰게 한다.
+        """
+        names = df['이름'].astype(str).str.strip()
+        return {name: pos for pos, name in enumerate(names)}
     
     def _create_age_bands(self) -> List[Tuple[int, int]]:
-        """나이 밴드를 생성합니다."""
-        min_age = self.df['나이_정제'].min()
-        max_age = self.df['나이_정제'].max()
-        
+        """나이 밴드를 생성합니다. (호출 간 캐시)"""
+        if self._cached_bands is not None:
+            return self._cached_bands
+
+        ages = self.df['나이_정제'].to_numpy()
         bands = []
-        current = min_age
-        band_size = self.age_tolerance * 2
-        
-        while current <= max_age:
-            band_end = min(current + band_size, max_age + 1)
-            bands.append((current, band_end))
-            current = band_end
-        
+
+        if ages.size > 0:
+            min_age = ages.min()
+            max_age = ages.max()
+
+            current = min_age
+            band_size = self.age_tolerance * 2
+
+            while current <= max_age:
+                band_end = min(current + band_size, max_age + 1)
+                bands.append((current, band_end))
+                current = band_end
+
+        self._cached_bands = bands
         return bands
     
-    def _snake_sort(self, members: pd.DataFrame, num_groups: int = None) -> pd.DataFrame:
-        """S자형(스네이크) 배치 알고리즘"""
-        sorted_members = members.sort_values('출석점수', ascending=False).reset_index(drop=True)
-        
-        num_members = len(sorted_members)
-        if num_groups is None:
-            num_groups = max(1, (num_members + self.group_size - 1) // self.group_size)
-        
-        group_assignments = []
-        
-        for idx in range(num_members):
-            row = idx // num_groups
-            pos_in_row = idx % num_groups
-            
-            if row % 2 == 0:
-                group_num = pos_in_row
-            else:
-                group_num = num_groups - 1 - pos_in_row
-            
-            group_assignments.append(group_num)
-        
-        sorted_members['그룹_내_번호'] = group_assignments
-        
-        return sorted_members
-    
     def _apply_leader_constraints(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Set[str]]:
         """
         리더 제약 조건 적용: 리더로 지정된 인원을 별도로 분리
@@ -95,16 +120,15 @@ class GroupSorter:
         Returns:
             (리더 제외된 DataFrame, 리더 이름 집합)
         """
-        if self.constraint_manager is None:
+        if not self._has_leaders:
             return df, set()
-        
+
         leaders = self.constraint_manager.get_leaders()
-        if not leaders:
-            return df, set()
         
-        # 리더 제외
-        leader_mask = df['이름'].astype(str).str.strip().isin(leaders)
-        non_leaders = df[~leader_mask].copy()
+        # 리더 제외 (캐시된 정제 이름 배열 재사용)
+        # 불리언 인덱싱 결과가 이미 새 프레임이므로 추가 copy는 불필요
+        leader_mask = np.isin(self._stripped_names, list(leaders))
+        non_leaders = df[~leader_mask]
         
         return non_leaders, leaders
     
@@ -113,73 +137,69 @@ class GroupSorter:
         포함 제약 조건 적용: 같은 조에 있어야 하는 쌍을 묶음
         person1과 같은 그룹에 person2를 배정
         """
-        if self.constraint_manager is None:
+        if not self._has_include:
             return df
-        
+
         include_pairs = self.constraint_manager.get_include_pairs()
-        if not include_pairs:
-            return df
-        
-        result = df.copy()
-        
+
+        result = df  # 제자리 수정 (호출부가 방금 만든 프레임을 넘김)
+        pos = self._name_positions(result)
+        col = result.columns.get_loc('_조번호')
+
         for person1, person2 in include_pairs:
-            # person1의 그룹 찾기
-            mask1 = result['이름'].astype(str).str.strip() == person1
-            mask2 = result['이름'].astype(str).str.strip() == person2
-            
-            if mask1.any() and mask2.any():
-                group1 = result.loc[mask1, '그룹_내_번호'].iloc[0]
+            idx1 = pos.get(person1)
+            idx2 = pos.get(person2)
+
+            if idx1 is not None and idx2 is not None:
                 # person2의 그룹을 person1과 동일하게 변경
-                result.loc[mask2, '그룹_내_번호'] = group1
-        
+                result.iat[idx2, col] = result.iat[idx1, col]
+
         return result
     
-    def _apply_exclude_constraints(self, df: pd.DataFrame, max_iterations: int = 50) -> pd.DataFrame:
+    def _apply_exclude_constraints(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         분리 제약 조건 적용: 같은 조에 있으면 안 되는 쌍을 분리
-        위반 시 다른 그룹의 인원과 swap
+
+        분리 쌍을 그래프로 보고 한 번의 패스로 해소한다. 위반자를
+        "자신의 모든 분리 상대가 없는 조" 중 가장 인원이 적은 곳으로
+        옮기므로 이미 처리한 쌍이 다시 위반되지 않는다 — 고정점 반복이
+        필요 없다.
         """
-        if self.constraint_manager is None:
+        if not self._has_exclude:
             return df
-        
+
         exclude_pairs = self.constraint_manager.get_exclude_pairs()
-        if not exclude_pairs:
-            return df
-        
-        result = df.copy()
-        
-        for _ in range(max_iterations):
-            violations_fixed = True
-            
-            for person1, person2 in exclude_pairs:
-                mask1 = result['이름'].astype(str).str.strip() == person1
-                mask2 = result['이름'].astype(str).str.strip() == person2
-                
-                if not (mask1.any() and mask2.any()):
-                    continue
-                
-                group1 = result.loc[mask1, '그룹_내_번호'].iloc[0]
-                group2 = result.loc[mask2, '그룹_내_번호'].iloc[0]
-                
-                if group1 == group2:
-                    # 위반! person2를 다른 그룹으로 swap
-                    other_groups = result[result['그룹_내_번호'] != group1]['그룹_내_번호'].unique()
-                    
-                    if len(other_groups) > 0:
-                        target_group = other_groups[0]
-                        # 타겟 그룹에서 랜덤 인원과 swap
-                        swap_candidates = result[result['그룹_내_번호'] == target_group]
-                        if len(swap_candidates) > 0:
-                            swap_idx = swap_candidates.index[0]
-                            # person2의 그룹을 target_group으로
-                            result.loc[mask2, '그룹_내_번호'] = target_group
-                            # swap 대상의 그룹을 group1으로
-                            result.loc[swap_idx, '그룹_내_번호'] = group1
-                            violations_fixed = False
-            
-            if violations_fixed:
-                break
-        
+
+        result = df  # 제자리 수정 (호출부가 방금 만든 프레임을 넘김)
+        pos = self._name_positions(result)
+        col = result.columns.get_loc('_조번호')
+
+        groups_arr = result.iloc[:, col].to_numpy()
+        name_to_group = {name: groups_arr[i] for name, i in pos.items()}
+        unique, counts = np.unique(groups_arr, return_counts=True)
+        sizes = dict(zip(unique.tolist(), counts.tolist()))
+
+        for person1, person2 in exclude_pairs:
+            group1 = name_to_group.get(person1)
+            group2 = name_to_group.get(person2)
+
+            if group1 is None or group2 is None or group1 != group2:
+                continue
+
+            # 위반! person2의 분리 상대가 아무도 없는 조 중 최소 인원 조로 이동
+            blocked = {
+                name_to_group.get(n)
+                for n in self.constraint_manager.get_exclude_neighbors(person2)
+            }
+            candidates = [g for g in sizes if g not in blocked]
+
+            if candidates:
+                target_group = min(candidates, key=sizes.get)
+                result.iat[pos[person2], col] = target_group
+                name_to_group[person2] = target_group
+                sizes[group1] -= 1
+                sizes[target_group] += 1
+
         return result
     
     def sort_into_groups(self) -> pd.DataFrame:
@@ -193,8 +213,6 @@ class GroupSorter:
         4. 분리(Exclude) 제약 조건 후처리
         5. 리더 배정 및 자동 선정
         """
-        import re
-        
         # 1. 리더 분리 (제약조건으로 지정된 리더)
         working_df, designated_leaders = self._apply_leader_constraints(self.df)
         
@@ -205,65 +223,58 @@ class GroupSorter:
         # 2. 포함(Include) 제약 조건 사전 처리: 쌍의 나이를 맞춤
         working_df = self._preprocess_include_constraints(working_df)
         
-        # 3. 나이 밴드 생성
-        age_bands = self._create_age_bands()
-        
-        # 4. 밴드별로 멤버 분류
-        band_members = []
-        for band_start, band_end in age_bands:
-            mask = (working_df['나이_정제'] >= band_start) & (working_df['나이_정제'] < band_end)
-            members = working_df[mask].copy()
-            if len(members) > 0:
-                band_members.append({
-                    'band': (band_start, band_end),
-                    'members': members,
-                    'count': len(members)
-                })
-        
-        # 5. 잔여 인원 병합 (80% 규칙)
+        # 3~5. 나이 밴드 계산 + 80% 미만 밴드 병합
+        # (밴드별 불리언 마스크/copy/concat 없이 행별 밴드 id 한 번에 계산)
         threshold = int(self.group_size * 0.8)
-        merged_bands = self._merge_small_bands(band_members, threshold)
-        
-        # 6. 각 밴드 내에서 조 편성
-        all_results = []
-        global_group_counter = 1
-        
-        for band_info in merged_bands:
-            members = band_info['members']
-            if len(members) == 0:
-                continue
-            
-            # 밴드 내 조 개수 결정 (v2.5: 80%~120% 규칙)
-            band_count = len(members)
+        band_ids = self._assign_band_ids(working_df, threshold)
+
+        # 6. 밴드 → 조 편성을 단일 파이프라인으로 수행
+        # (밴드별 부분 프레임 생성과 밴드별 concat 없이: 한 번의 전역 정렬
+        #  후 밴드 구간별 스네이크 번호에 전역 오프셋을 더해 _조번호 확정)
+        if len(working_df) > 0:
+            work = working_df.assign(_밴드=band_ids).sort_values(
+                ['_밴드', '출석점수'], ascending=[True, False]
+            ).reset_index(drop=True)
+
+            band_arr = work['_밴드'].to_numpy()
+            uniq, counts = np.unique(band_arr, return_counts=True)
+
+            # 밴드별 조 개수 결정 (v2.5: 80%~120% 규칙) — 밴드 수는 작음
             min_per_group = max(1, int(self.group_size * 0.8))
             max_per_group = int(self.group_size * 1.2)
-            
-            min_groups = max(1, -(-band_count // max_per_group))
-            max_groups = max(1, band_count // min_per_group)
-            ideal_groups = round(band_count / self.group_size)
-            num_groups_in_band = max(min_groups, min(max_groups, ideal_groups))
-            
-            # S자형 배치
-            sorted_band = self._snake_sort(members, num_groups_in_band)
-            
-            # 포함 제약 조건 적용 (밴드 내)
-            sorted_band = self._apply_include_constraints(sorted_band)
-            
-            # 전역 그룹 번호 할당
-            unique_local_groups = sorted(sorted_band['그룹_내_번호'].unique())
-            local_to_global = {local: global_group_counter + i 
-                             for i, local in enumerate(unique_local_groups)}
-            
-            sorted_band['소그룹명'] = sorted_band['그룹_내_번호'].map(
-                lambda x: f"{local_to_global[x]}조"
+            num_groups_arr = np.empty(len(uniq), dtype=np.int64)
+            for i, band_count in enumerate(counts):
+                band_count = int(band_count)
+                min_groups = max(1, -(-band_count // max_per_group))
+                max_groups = max(1, band_count // min_per_group)
+                ideal_groups = round(band_count / self.group_size)
+                num_groups_arr[i] = max(min_groups, min(max_groups, ideal_groups))
+
+            # S자형 배치: 정렬된 프레임에서 밴드는 연속 구간이므로
+            # 구간별 스네이크 번호 + 누적 오프셋으로 전역 조 번호를 얻는다
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            offsets = np.concatenate(([0], np.cumsum(num_groups_arr)[:-1]))
+            group_no = np.empty(len(work), dtype=np.int32)
+            for start, count, n_groups, offset in zip(starts, counts, num_groups_arr, offsets):
+                end = start + count
+                group_no[start:end] = _snake_assign(int(count), int(n_groups)) + offset + 1
+
+            work['_조번호'] = group_no
+            total_groups = int(num_groups_arr.sum())
+
+            # 포함/분리 제약 조건을 전역 조 번호 위에서 적용 (v2.5 4단계)
+            work = self._apply_include_constraints(work)
+            work = self._apply_exclude_constraints(work)
+
+            # 'N조' 라벨은 여기서 한 번만 생성
+            # (행마다 f-string을 만들지 않고 int 코드 -> category 라벨로 변환)
+            self.result_df = work.drop(columns='_밴드')
+            codes = self.result_df['_조번호'].to_numpy() - 1
+            categories = [f"{i}조" for i in range(1, total_groups + 1)]
+            self.result_df['소그룹명'] = pd.Categorical.from_codes(
+                codes, categories=categories, ordered=True
             )
-            
-            global_group_counter += len(unique_local_groups)
-            all_results.append(sorted_band)
-        
-        # 7. 결과 병합
-        if all_results:
-            self.result_df = pd.concat(all_results, ignore_index=True)
+            self.result_df = self.result_df.drop(columns='_조번호')
         else:
             self.result_df = pd.DataFrame(columns=working_df.columns.tolist() + ['소그룹명'])
         
@@ -276,16 +287,33 @@ class GroupSorter:
         
         self.result_df = self.result_df[available_columns]
         
-        # 마지막으로 조별 정렬 (1조, 2조, ...)
-        def natural_sort_key(s):
-            return [int(text) if text.isdigit() else text.lower()
-                    for text in re.split('([0-9]+)', str(s))]
-        
-        self.result_df = self.result_df.sort_values(
-            by='소그룹명', 
-            key=lambda x: x.map(natural_sort_key)
-        ).reset_index(drop=True)
-        
+        # 반복되는 == 비교와 groupby가 int 코드 경로를 타도록
+        # 저카디널리티 컬럼을 category로 변환 (조 이름은 숫자 순서로 ordered)
+        # — 위 from_codes 경로를 탔다면 이미 ordered category
+        if not isinstance(self.result_df['소그룹명'].dtype, pd.CategoricalDtype):
+            def _group_num(name):
+                match = re.search(r'\d+', str(name))
+                return int(match.group()) if match else 0
+
+            sorted_groups = sorted(self.result_df['소그룹명'].unique(), key=_group_num)
+            self.result_df['소그룹명'] = pd.Categorical(
+                self.result_df['소그룹명'], categories=sorted_groups, ordered=True
+            )
+        if '분류결과' in self.result_df.columns and \
+                not isinstance(self.result_df['분류결과'].dtype, pd.CategoricalDtype):
+            # 표준 3종 외의 값이 들어와도 잃지 않도록 관측된 값을 덧붙임
+            categories = ['리더', '일반', '케어 대상']
+            categories += [
+                v for v in self.result_df['분류결과'].dropna().unique()
+                if v not in categories
+            ]
+            self.result_df['분류결과'] = pd.Categorical(
+                self.result_df['분류결과'], categories=categories
+            )
+
+        # 마지막으로 조별 정렬 (1조, 2조, ...) — ordered category 코드로 정렬
+        self.result_df = self.result_df.sort_values('소그룹명').reset_index(drop=True)
+
         return self.result_df
     
     def _preprocess_include_constraints(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -293,108 +321,119 @@ class GroupSorter:
         포함 제약 조건 사전 처리: 같이 있어야 할 쌍의 나이를 맞춤
         person2의 나이를 person1의 나이로 임시 조정하여 같은 밴드에 배치되도록 함
         """
-        if self.constraint_manager is None:
+        if not self._has_include:
             return df
-        
+
         include_pairs = self.constraint_manager.get_include_pairs()
-        if not include_pairs:
-            return df
-        
-        result = df.copy()
         
+        # 제자리 수정 — df는 __init__에서 복사한 sorter 내부 프레임(또는
+        # 거기서 파생된 프레임)이므로 호출자 데이터는 건드리지 않는다.
+        result = df
+        pos = self._name_positions(result)
+        col = result.columns.get_loc('나이_정제')
+
         for person1, person2 in include_pairs:
-            mask1 = result['이름'].astype(str).str.strip() == person1
-            mask2 = result['이름'].astype(str).str.strip() == person2
-            
-            if mask1.any() and mask2.any():
-                age1 = result.loc[mask1, '나이_정제'].iloc[0]
+            idx1 = pos.get(person1)
+            idx2 = pos.get(person2)
+
+            if idx1 is not None and idx2 is not None:
                 # person2의 나이를 person1과 동일하게 조정 (같은 밴드에 배치)
-                result.loc[mask2, '나이_정제'] = age1
-        
+                result.iat[idx2, col] = result.iat[idx1, col]
+
+        # 나이가 바뀌었을 수 있으므로 밴드 캐시 무효화
+        self._cached_bands = None
+
         return result
     
     def _apply_exclude_constraints_global(self):
         """
         분리 제약 조건 전역 후처리: 같은 조에 있으면 안 되는 쌍을 분리
         """
-        if self.constraint_manager is None or self.result_df is None:
+        if not self._has_exclude or self.result_df is None:
             return
-        
+
         exclude_pairs = self.constraint_manager.get_exclude_pairs()
-        if not exclude_pairs:
-            return
         
-        for _ in range(50):  # 최대 50회 반복
-            violations_fixed = True
-            
-            for person1, person2 in exclude_pairs:
-                mask1 = self.result_df['이름'].astype(str).str.strip() == person1
-                mask2 = self.result_df['이름'].astype(str).str.strip() == person2
-                
-                if not (mask1.any() and mask2.any()):
-                    continue
-                
-                group1 = self.result_df.loc[mask1, '소그룹명'].iloc[0]
-                group2 = self.result_df.loc[mask2, '소그룹명'].iloc[0]
-                
-                if group1 == group2:
-                    # 위반! person2를 다른 그룹으로 이동
-                    other_groups = self.result_df[self.result_df['소그룹명'] != group1]['소그룹명'].unique()
-                    
-                    if len(other_groups) > 0:
-                        # 가장 인원이 적은 조로 이동
-                        group_sizes = self.result_df.groupby('소그룹명').size()
-                        target_group = group_sizes[group_sizes.index.isin(other_groups)].idxmin()
-                        
-                        # person2를 target_group으로 이동
-                        self.result_df.loc[mask2, '소그룹명'] = target_group
-                        violations_fixed = False
-            
-            if violations_fixed:
-                break
+        # 조 소속/크기를 dict로 들고 swap마다 O(1) 갱신
+        # (반복문 안에서 groupby().size()를 다시 계산하지 않도록)
+        stripped = self.result_df['이름'].astype(str).str.strip()
+        name_to_group = dict(zip(stripped, self.result_df['소그룹명']))
+        sizes = self.result_df.groupby('소그룹명', observed=True).size().to_dict()
+
+        # 분리 그래프 단일 패스: 위반자를 "자신의 모든 분리 상대가 없는 조"
+        # 중 최소 인원 조로 옮기므로 처리한 쌍이 다시 위반되지 않는다
+        # (고정점 반복 불필요)
+        moved = set()
+        for person1, person2 in exclude_pairs:
+            group1 = name_to_group.get(person1)
+            group2 = name_to_group.get(person2)
+
+            if group1 is None or group2 is None or group1 != group2:
+                continue
+
+            # 위반! person2의 분리 상대가 아무도 없는 조 중 최소 인원 조로 이동
+            blocked = {
+                name_to_group.get(n)
+                for n in self.constraint_manager.get_exclude_neighbors(person2)
+            }
+            candidates = [g for g in sizes if g not in blocked]
+
+            if candidates:
+                target_group = min(candidates, key=sizes.get)
+                name_to_group[person2] = target_group
+                sizes[group1] -= 1
+                sizes[target_group] += 1
+                moved.add(person2)
+
+        if moved:
+            # 실제로 이동한 이름만 한 번의 벡터 연산으로 결과 프레임에 반영
+            mask = stripped.isin(moved)
+            self.result_df.loc[mask, '소그룹명'] = stripped[mask].map(name_to_group)
     
-    def _merge_small_bands(self, band_members: List[dict], threshold: int) -> List[dict]:
-        """
-        목표 인원의 80% 미만인 밴드를 인접 밴드와 병합합니다.
+    def _assign_band_ids(self, working_df: pd.DataFrame, threshold: int) -> np.ndarray:
+        """행별 나이 밴드 id를 계산하고 소규모 밴드를 병합합니다.
+
+        밴드 경계에 대한 searchsorted 한 번으로 행별 밴드를 정하고,
+        threshold(목표 인원의 80%) 미만인 밴드는 정수 remap 테이블로
+        인접 밴드에 합친다 — 기존 병합 규칙(다음 밴드 우선, 마지막
+        밴드는 직전 병합 결과와 합침) 그대로, 밴드별 copy/concat 없이.
         """
-        if len(band_members) <= 1:
-            return band_members
-        
-        merged = []
+        bands = self._create_age_bands()
+        if len(working_df) == 0 or not bands:
+            return np.array([], dtype=np.int64)
+
+        edges = np.array([b[0] for b in bands] + [bands[-1][1]])
+        ages = working_df['나이_정제'].to_numpy()
+        band_id = np.clip(np.searchsorted(edges, ages, side='right') - 1, 0, len(bands) - 1)
+
+        # 인원이 있는 밴드만 놓고 병합 규칙 적용
+        counts = np.bincount(band_id, minlength=len(bands))
+        non_empty = np.flatnonzero(counts).tolist()
+
+        merged_ids: List[List[int]] = []  # 병합 단위별 원본 밴드 id 목록
         i = 0
-        
-        while i < len(band_members):
-            current = band_members[i]
-            
-            # 현재 밴드가 threshold 미만이면 인접 밴드와 병합 시도
-            if current['count'] < threshold:
+        while i < len(non_empty):
+            bid = non_empty[i]
+            if counts[bid] < threshold:
                 # 다음 밴드와 병합
-                if i + 1 < len(band_members):
-                    next_band = band_members[i + 1]
-                    combined_members = pd.concat([current['members'], next_band['members']], ignore_index=True)
-                    merged.append({
-                        'band': (current['band'][0], next_band['band'][1]),
-                        'members': combined_members,
-                        'count': len(combined_members)
-                    })
-                    i += 2  # 두 밴드를 합쳤으므로 2개 건너뜀
+                if i + 1 < len(non_empty):
+                    merged_ids.append([bid, non_empty[i + 1]])
+                    i += 2
                     continue
                 # 이전 밴드와 병합 (마지막 밴드인 경우)
-                elif len(merged) > 0:
-                    prev_band = merged.pop()
-                    combined_members = pd.concat([prev_band['members'], current['members']], ignore_index=True)
-                    merged.append({
-                        'band': (prev_band['band'][0], current['band'][1]),
-                        'members': combined_members,
-                        'count': len(combined_members)
-                    })
+                elif merged_ids:
+                    merged_ids[-1].append(bid)
                     i += 1
                     continue
-            
-            merged.append(current)
+            merged_ids.append([bid])
             i += 1
-        
-        return merged
+
+        remap = np.zeros(len(bands), dtype=np.int64)
+        for new_id, ids in enumerate(merged_ids):
+            for bid in ids:
+                remap[bid] = new_id
+
+        return remap[band_id]
 
     def _assign_leaders_to_groups(self, leaders: Set[str], num_groups: int):
         """
@@ -405,81 +444,93 @@ class GroupSorter:
         if self.result_df.empty:
             return
         
-        # 1. 리더 정보 수집
-        leader_list = list(leaders)
+        # 1. 리더 정보 수집: 위치 목록을 만들어 한 번의 iloc으로 모은 뒤
+        # itertuples로 순회 (리더마다 iloc[pos].to_dict()를 부르지 않음)
+        positions = [
+            self._name_to_idx[name] for name in leaders if name in self._name_to_idx
+        ]
+        leader_df = self.df.iloc[positions]
+
+        if '나이_정제' in leader_df.columns:
+            age_col = '나이_정제'
+        elif '나이' in leader_df.columns:
+            age_col = '나이'
+        else:
+            age_col = None
+
+        # name=None 튜플 + zip으로 dict 구성 — itertuples의 기본 rename이
+        # 식별자가 아닌 컬럼명(공백/괄호 등 엑셀 헤더)을 _N으로 바꾸는 것을 방지
+        columns = leader_df.columns
         leader_rows = []
-        for name in leader_list:
-            data = self.df[self.df['이름'].astype(str).str.strip() == name]
-            if len(data) > 0:
-                row = data.iloc[0].to_dict()
-                row['분류결과'] = '리더'
-                if '나이_정제' in row:
-                    row['리더나이'] = row['나이_정제']
-                elif '나이' in row:
-                    row['리더나이'] = pd.to_numeric(row['나이'], errors='coerce')
-                else:
-                    row['리더나이'] = 0
-                leader_rows.append(row)
-        
-        # 2. 각 조의 나이 통계 계산 (중앙값, 최소, 최대)
-        group_age_stats = {}
-        for group_name in self.result_df['소그룹명'].unique():
-            group_df = self.result_df[self.result_df['소그룹명'] == group_name]
-            if '나이' in group_df.columns:
-                ages = pd.to_numeric(group_df['나이'], errors='coerce').dropna()
-            elif '나이_정제' in group_df.columns:
-                ages = group_df['나이_정제'].dropna()
-            else:
-                ages = pd.Series([0])
-            
-            if len(ages) > 0:
-                group_age_stats[group_name] = {
-                    'median': ages.median(),
-                    'min': ages.min(),
-                    'max': ages.max(),
-                    'count': len(group_df)
-                }
+        for tup in leader_df.itertuples(index=False, name=None):
+            row = dict(zip(columns, tup))
+            row['분류결과'] = '리더'
+            if age_col == '나이_정제':
+                row['리더나이'] = row['나이_정제']
+            elif age_col == '나이':
+                row['리더나이'] = pd.to_numeric(row['나이'], errors='coerce')
             else:
-                group_age_stats[group_name] = {'median': 0, 'min': 0, 'max': 0, 'count': 0}
-        
-        # 3. 이미 리더가 있는 조 목록
-        groups_with_leaders = set()
+                row['리더나이'] = 0
+            leader_rows.append(row)
+        
+        # 2. 각 조의 나이 통계(중앙값/최소/최대)를 groupby 한 번으로 계산
+        if '나이' in self.result_df.columns:
+            ages = pd.to_numeric(self.result_df['나이'], errors='coerce')
+        elif '나이_정제' in self.result_df.columns:
+            ages = self.result_df['나이_정제']
+        else:
+            ages = pd.Series(0, index=self.result_df.index)
+
+        stats = ages.groupby(self.result_df['소그룹명'], observed=True).agg(
+            ['median', 'min', 'max']
+        )
+        groups_arr = stats.index.to_numpy()
+        medians = stats['median'].fillna(0).to_numpy()
+        mins = stats['min'].fillna(0).to_numpy()
+        maxs = stats['max'].fillna(0).to_numpy()
+
+        # 3. 이미 리더가 있는 조 -> 배정 후보 마스크
+        available_mask = np.ones(len(groups_arr), dtype=bool)
         if '분류결과' in self.result_df.columns:
-            for group_name in self.result_df['소그룹명'].unique():
-                group_df = self.result_df[self.result_df['소그룹명'] == group_name]
-                if (group_df['분류결과'] == '리더').any():
-                    groups_with_leaders.add(group_name)
-        
+            has_leader = (self.result_df['분류결과'] == '리더').groupby(
+                self.result_df['소그룹명'], observed=True
+            ).any()
+            available_mask = ~has_leader.reindex(stats.index).fillna(False).to_numpy()
+
         # 4. 각 리더를 나이에 맞는 조에 배정
+        # (최적 조 선택: 파이썬 min+closure 대신 브로드캐스트 페널티의 argmin)
+        new_rows = []
         for row in leader_rows:
             leader_age = row.get('리더나이', 0)
-            
+
             # 리더가 없는 조만 후보로 (1조 1리더 강제)
-            available_groups = [g for g in group_age_stats.keys() if g not in groups_with_leaders]
-            
-            if not available_groups:
+            if not available_mask.any():
                 # 모든 조에 리더가 있으면 배정하지 않고 경고 로그
                 print(f"⚠️ 경고: 모든 조에 리더가 이미 배정되어 '{row.get('이름', '')}' 리더를 추가 배정할 수 없습니다.")
                 continue  # 중복 배정 방지
-            
+
             # 최적의 조 선택 (나이 범위 포함 여부 > 중앙값 차이)
-            def score_group(g):
-                stats = group_age_stats[g]
-                in_range = stats['min'] <= leader_age <= stats['max']
-                median_diff = abs(stats['median'] - leader_age)
-                # 범위 내에 있으면 0점, 아니면 100점 + 중앙값 차이
-                return (0 if in_range else 100) + median_diff
-            
-            best_group = min(available_groups, key=score_group)
-            
+            # 범위 내에 있으면 0점, 아니면 100점 + 중앙값 차이
+            in_range = (mins <= leader_age) & (leader_age <= maxs)
+            penalty = np.where(in_range, 0.0, 100.0) + np.abs(medians - leader_age)
+            penalty[~available_mask] = np.inf
+            best_idx = int(penalty.argmin())
+            best_group = groups_arr[best_idx]
+
             row['소그룹명'] = best_group
-            groups_with_leaders.add(best_group)
-            
+            available_mask[best_idx] = False
+
             if '리더나이' in row:
                 del row['리더나이']
-            
-            new_row_df = pd.DataFrame([row])
-            self.result_df = pd.concat([new_row_df, self.result_df], ignore_index=True)
+
+            new_rows.append(row)
+
+        # 리더 행을 모아 한 번의 concat으로 삽입
+        # (리더마다 전체 프레임을 재할당하는 O(L^2) 패턴 제거)
+        if new_rows:
+            self.result_df = pd.concat(
+                [pd.DataFrame(new_rows), self.result_df], ignore_index=True
+            )
 
     
     def _auto_assign_leaders(self):
@@ -489,7 +540,11 @@ class GroupSorter:
         """
         if self.result_df is None or len(self.result_df) == 0:
             return
-        
+
+        # 분류결과 스칼라 기록은 라벨 해석 없는 위치 기반 iat로
+        cls_col = self.result_df.columns.get_loc('분류결과')
+        row_pos = {label: pos for pos, label in enumerate(self.result_df.index)}
+
         for group_name in self.result_df['소그룹명'].unique():
             group_mask = self.result_df['소그룹명'] == group_name
             group_df = self.result_df[group_mask]
@@ -519,7 +574,7 @@ class GroupSorter:
             
             if len(sorted_candidates) > 0:
                 leader_idx = sorted_candidates.index[0]
-                self.result_df.loc[leader_idx, '분류결과'] = '리더'
+                self.result_df.iat[row_pos[leader_idx], cls_col] = '리더'
     
 
     
@@ -528,19 +583,23 @@ class GroupSorter:
         if self.result_df is None:
             raise ValueError("먼저 sort_into_groups()를 실행하세요.")
         
-        import re
-        
         temp_df = self.result_df.copy()
         temp_df['나이_숫자'] = pd.to_numeric(temp_df['나이'], errors='coerce')
-        
-        stats = temp_df.groupby('소그룹명').agg(
+
+        # 그룹별 파이썬 콜백(lambda) 대신 미리 계산한 불리언 컬럼의 sum으로
+        # 집계 전체가 C 경로의 이름 있는 리덕션만 타게 한다
+        temp_df['_리더'] = (temp_df['분류결과'] == '리더').astype(np.int8)
+        temp_df['_케어'] = (temp_df['분류결과'] == '케어 대상').astype(np.int8)
+
+        stats = temp_df.groupby('소그룹명', observed=True).agg(
             인원수=('이름', 'count'),
-            평균나이=('나이_숫자', lambda x: round(x.mean(), 1)),
+            평균나이=('나이_숫자', 'mean'),
             최소나이=('나이_숫자', 'min'),
             최대나이=('나이_숫자', 'max'),
-            리더수=('분류결과', lambda x: (x == '리더').sum()),
-            케어대상수=('분류결과', lambda x: (x == '케어 대상').sum())
+            리더수=('_리더', 'sum'),
+            케어대상수=('_케어', 'sum')
         ).reset_index()
+        stats['평균나이'] = stats['평균나이'].round(1)
         
         # 조 이름을 숫자 기준으로 오름차순 정렬 (1조, 2조, ..., 10조)
         def extract_group_number(name):
@@ -558,29 +617,32 @@ class GroupSorter:
         
         if self.constraint_manager is None or self.result_df is None:
             return violations
-        
+
+        pos = self._name_positions(self.result_df)
+        col = self.result_df.columns.get_loc('소그룹명')
+
         # 분리 조건 위반 검사
         for person1, person2 in self.constraint_manager.get_exclude_pairs():
-            mask1 = self.result_df['이름'].astype(str).str.strip() == person1
-            mask2 = self.result_df['이름'].astype(str).str.strip() == person2
-            
-            if mask1.any() and mask2.any():
-                group1 = self.result_df.loc[mask1, '소그룹명'].iloc[0]
-                group2 = self.result_df.loc[mask2, '소그룹명'].iloc[0]
-                
+            idx1 = pos.get(person1)
+            idx2 = pos.get(person2)
+
+            if idx1 is not None and idx2 is not None:
+                group1 = self.result_df.iat[idx1, col]
+                group2 = self.result_df.iat[idx2, col]
+
                 if group1 == group2:
                     violations.append(f"⚠️ 분리 위반: {person1}와 {person2}가 같은 조({group1})에 있습니다")
-        
+
         # 포함 조건 위반 검사
         for person1, person2 in self.constraint_manager.get_include_pairs():
-            mask1 = self.result_df['이름'].astype(str).str.strip() == person1
-            mask2 = self.result_df['이름'].astype(str).str.strip() == person2
-            
-            if mask1.any() and mask2.any():
-                group1 = self.result_df.loc[mask1, '소그룹명'].iloc[0]
-                group2 = self.result_df.loc[mask2, '소그룹명'].iloc[0]
-                
+            idx1 = pos.get(person1)
+            idx2 = pos.get(person2)
+
+            if idx1 is not None and idx2 is not None:
+                group1 = self.result_df.iat[idx1, col]
+                group2 = self.result_df.iat[idx2, col]
+
                 if group1 != group2:
                     violations.append(f"⚠️ 포함 위반: {person1}와 {person2}가 다른 조에 있습니다 ({group1} vs {group2})")
-        
+
         return violations